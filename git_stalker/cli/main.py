@@ -1,24 +1,20 @@
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
-import json
+import orjson
 from rich.console import Console
-from typer import Typer, Argument, Option
+from rich.markup import escape
+from rich.text import Text
+from typer import Typer, Argument, Exit, Option
 
 from git_stalker.config import get_github_token
-from git_stalker.core import ActivityTracker, GitHubActivitySource
+from git_stalker.core import ActivityTracker, CredentialsError, GitHubActivitySource
 from git_stalker.core.logging import setup_logging
 
 app = Typer()
 console = Console()
 
-class ActivityJSONEncoder(json.JSONEncoder):
-    """Custom JSON encoder for Activity objects."""
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
-
 def activity_to_dict(activity) -> Dict[str, Any]:
     """Convert an activity to a dictionary for JSON serialization."""
     return {
@@ -67,16 +63,30 @@ def track_activity(
         if output_format == "json":
             # Convert activities to JSON
             activities_json = [activity_to_dict(activity) for activity in activities]
-            console.print(json.dumps(activities_json, cls=ActivityJSONEncoder, indent=2))
+            # Write bytes straight to stdout, Rich markup/wrapping is not wanted here
+            sys.stdout.buffer.write(
+                orjson.dumps(
+                    activities_json,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC,
+                )
+            )
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.flush()
         else:
-            # Pretty print format
+            # Pretty print format, rendered up front and printed in one batch
+            lines = []
             for activity in activities:
-                console.print(f"[bold blue]{activity.timestamp.strftime('%Y-%m-%d %H:%M:%S')}[/bold blue]")
-                console.print(f"[bold]{activity.source}[/bold]: {activity.message}")
-                console.print()
+                lines.append(console.render_str(f"[bold blue]{activity.timestamp.strftime('%Y-%m-%d %H:%M:%S')}[/bold blue]"))
+                lines.append(console.render_str(f"[bold]{escape(activity.source)}[/bold]: {escape(activity.message)}"))
+                lines.append(Text())
+            if lines:
+                console.print(*lines, sep="\n")
     
+    except CredentialsError as e:
+        logger.error("%s. Check GITHUB_TOKEN in your .env file.", e)
+        raise Exit(code=1)
     except Exception as e:
-        logger.exception(f"Error in track_activity: {str(e)}")
+        logger.exception("Error in track_activity: %s", e)
         raise
 
 def main():
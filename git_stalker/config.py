@@ -1,16 +1,22 @@
 import os
+from functools import cache
 from typing import Optional
 from dotenv import load_dotenv
 
+@cache
+def _ensure_dotenv() -> None:
+    """Load the .env file into the environment once per process."""
+    _ = load_dotenv()
+
 def get_github_token() -> str:
     """Get GitHub token from environment variables."""
-    _ = load_dotenv()
-    token = os.getenv("GITHUB_TOKEN")
+    _ensure_dotenv()
+    token = os.environ.get("GITHUB_TOKEN")
     if not token:
         raise ValueError("GitHub token is missing. Please set it in the .env file.")
     return token
 
 def get_env_var(key: str, default: Optional[str] = None) -> Optional[str]:
     """Get environment variable with optional default value."""
-    _ = load_dotenv()
-    return os.getenv(key, default) 
\ No newline at end of file
+    _ensure_dotenv()
+    return os.environ.get(key, default)
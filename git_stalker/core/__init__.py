@@ -1,4 +1,4 @@
-from .base import ActivitySource, Activity, ActivityTracker
+from .base import ActivitySource, Activity, ActivityTracker, CredentialsError
 from .github import GitHubActivitySource
 
-__all__ = ['ActivitySource', 'Activity', 'ActivityTracker', 'GitHubActivitySource'] 
\ No newline at end of file
+__all__ = ['ActivitySource', 'Activity', 'ActivityTracker', 'CredentialsError', 'GitHubActivitySource'] 
\ No newline at end of file
@@ -1,9 +1,15 @@
+import heapq
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Protocol, runtime_checkable
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, Protocol
 from .logging import logger
+from ..config import get_env_var
 
-@dataclass(frozen=True)
+class CredentialsError(ValueError):
+    """Raised when a source rejects its configured credentials."""
+
+@dataclass(frozen=True, slots=True)
 class Activity:
     """Immutable activity data from any source."""
     source: str
@@ -12,7 +18,6 @@ class Activity:
     details: Dict[str, Any]
     message: str  # Human readable description of the activity
 
-@runtime_checkable
 class ActivitySource(Protocol):
     """Protocol defining the interface for activity sources."""
     
@@ -22,7 +27,7 @@ class ActivitySource(Protocol):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
     ) -> List[Activity]:
-        """Get activities for a user within the specified date range."""
+        """Get activities for a user within the specified date range, newest first."""
         ...
 
     def validate_credentials(self) -> bool:
@@ -38,21 +43,30 @@ class ActivityTracker:
 
     def add_source(self, source: ActivitySource) -> None:
         """Add a new activity source."""
-        self.logger.debug(f"Adding new source: {source.__class__.__name__}")
+        self.logger.debug("Adding new source: %s", source.__class__.__name__)
         
-        if not isinstance(source, ActivitySource):
-            self.logger.error(f"Invalid source type: {type(source)}")
+        # Plain attribute checks; a runtime_checkable isinstance is much slower
+        if not (
+            hasattr(source, "get_activities") and hasattr(source, "validate_credentials")
+        ):
+            self.logger.error("Invalid source type: %s", type(source))
             raise TypeError(f"Source must implement ActivitySource protocol")
         
+        # Credentials are checked by the first real request unless lazy auth is disabled
+        if get_env_var("GIT_STALKER_LAZY_AUTH", "1") != "0":
+            self.sources.append(source)
+            self.logger.info("Added source: %s", source.__class__.__name__)
+            return
+        
         try:
             if source.validate_credentials():
                 self.sources.append(source)
-                self.logger.info(f"Successfully added source: {source.__class__.__name__}")
+                self.logger.info("Successfully added source: %s", source.__class__.__name__)
             else:
-                self.logger.error(f"Invalid credentials for source: {source.__class__.__name__}")
-                raise ValueError(f"Invalid credentials for source: {source.__class__.__name__}")
+                self.logger.error("Invalid credentials for source: %s", source.__class__.__name__)
+                raise CredentialsError(f"Invalid credentials for source: {source.__class__.__name__}")
         except Exception as e:
-            self.logger.exception(f"Error adding source: {str(e)}")
+            self.logger.exception("Error adding source: %s", e)
             raise
 
     def get_all_activities(
@@ -62,24 +76,33 @@ class ActivityTracker:
         end_date: Optional[datetime] = None,
     ) -> List[Activity]:
         """Get activities from all sources."""
-        self.logger.info(f"Fetching activities for user: {username}")
-        self.logger.debug(f"Date range: {start_date} to {end_date}")
+        self.logger.info("Fetching activities for user: %s", username)
+        self.logger.debug("Date range: %s to %s", start_date, end_date)
         
-        activities = []
+        per_source_activities: List[List[Activity]] = []
         for source in self.sources:
             try:
-                self.logger.debug(f"Fetching from source: {source.__class__.__name__}")
+                self.logger.debug("Fetching from source: %s", source.__class__.__name__)
                 source_activities = source.get_activities(username, start_date, end_date)
-                activities.extend(source_activities)
+                per_source_activities.append(source_activities)
                 self.logger.debug(
-                    f"Retrieved {len(source_activities)} activities from {source.__class__.__name__}"
+                    "Retrieved %d activities from %s",
+                    len(source_activities),
+                    source.__class__.__name__,
                 )
+            except CredentialsError:
+                raise
             except Exception as e:
                 self.logger.error(
-                    f"Error fetching activities from {source.__class__.__name__}: {str(e)}"
+                    "Error fetching activities from %s: %s",
+                    source.__class__.__name__,
+                    e,
                 )
                 continue
         
-        sorted_activities = sorted(activities, key=lambda x: x.timestamp, reverse=True)
-        self.logger.info(f"Retrieved total of {len(sorted_activities)} activities")
+        # Each source is already newest first, so a k-way merge is enough
+        sorted_activities = list(
+            heapq.merge(*per_source_activities, key=attrgetter("timestamp"), reverse=True)
+        )
+        self.logger.info("Retrieved total of %d activities", len(sorted_activities))
         return sorted_activities 
\ No newline at end of file
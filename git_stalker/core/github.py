@@ -1,12 +1,225 @@
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from .base import Activity
+from .base import Activity, CredentialsError
 from .logging import logger
 from ..config import get_env_var
 
+# Upper bound on concurrent page requests; stays within the session pool size
+MAX_FETCH_WORKERS = 8
+
+def _build_session() -> requests.Session:
+    """Create the HTTP session shared by all GitHub sources."""
+    session = requests.Session()
+    
+    # Get retry configuration from environment
+    retry_total = int(get_env_var("GITHUB_RETRY_TOTAL", "0"))
+    retry_backoff = float(get_env_var("GITHUB_RETRY_BACKOFF", "0.1"))
+    
+    max_retries: Retry | int = 0
+    if retry_total > 0:
+        max_retries = Retry(
+            total=retry_total,
+            backoff_factor=retry_backoff,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        logger.debug(
+            "Configured request retries: total=%s, backoff=%s",
+            retry_total,
+            retry_backoff,
+        )
+    
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=max_retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Shared session so connections are pooled across sources and requests
+_SESSION = _build_session()
+
+# GitHub timestamps end in "Z", which fromisoformat only accepts natively on 3.11+
+if sys.version_info >= (3, 11):
+    _parse_ts = datetime.fromisoformat
+else:
+    def _parse_ts(value: str) -> datetime:
+        return datetime.fromisoformat(value[:-1] + "+00:00")
+
+# Shared read-only fallback for missing nested payload objects
+_EMPTY: Dict[str, Any] = {}
+
+# Base GitHub URL for constructing links
+_BASE_URL = "https://github.com"
+
+def _simplify_push(repo: str, repo_url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Simplify a PushEvent payload."""
+    get = payload.get
+    commits = get("commits") or ()
+    return {
+        "repository": repo,
+        "repository_url": repo_url,
+        "ref": get("ref", "unknown"),
+        "commit_count": len(commits),
+        "commit_messages": [
+            commit.get("message", "").split("\n")[0]  # First line only
+            for commit in commits[:3]  # First 3 commits only
+        ],
+        "compare_url": f"{repo_url}/compare/{get('before', '')}...{get('head', '')}"
+    }
+
+def _simplify_pull_request(repo: str, repo_url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Simplify a PullRequestEvent payload."""
+    pr_get = (payload.get("pull_request") or _EMPTY).get
+    return {
+        "action": payload.get("action", "unknown"),
+        "title": pr_get("title", "unknown"),
+        "number": pr_get("number", "unknown"),
+        "repository": repo,
+        "repository_url": repo_url,
+        "state": pr_get("state", "unknown"),
+        "url": pr_get("html_url"),
+    }
+
+def _simplify_issue(repo: str, repo_url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Simplify an IssuesEvent payload."""
+    issue_get = (payload.get("issue") or _EMPTY).get
+    return {
+        "action": payload.get("action", "unknown"),
+        "title": issue_get("title", "unknown"),
+        "number": issue_get("number", "unknown"),
+        "repository": repo,
+        "repository_url": repo_url,
+        "url": issue_get("html_url"),
+    }
+
+def _simplify_issue_comment(repo: str, repo_url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Simplify an IssueCommentEvent payload."""
+    get = payload.get
+    issue_get = (get("issue") or _EMPTY).get
+    comment_get = (get("comment") or _EMPTY).get
+    return {
+        "action": get("action", "unknown"),
+        "issue_number": issue_get("number", "unknown"),
+        "repository": repo,
+        "repository_url": repo_url,
+        "comment_fragment": comment_get("body", "")[:100] + "...",
+        "url": comment_get("html_url"),
+        "issue_url": issue_get("html_url"),
+    }
+
+def _simplify_create(repo: str, repo_url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Simplify a CreateEvent payload."""
+    ref_type = payload.get("ref_type", "unknown")
+    ref = payload.get("ref", "unknown")
+    return {
+        "ref_type": ref_type,
+        "ref": ref,
+        "repository": repo,
+        "repository_url": repo_url,
+        "url": (
+            f"{repo_url}/tree/{ref}" if ref_type == "branch"
+            else f"{repo_url}/releases/tag/{ref}" if ref_type == "tag"
+            else repo_url
+        ),
+    }
+
+def _simplify_delete(repo: str, repo_url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Simplify a DeleteEvent payload."""
+    get = payload.get
+    return {
+        "ref_type": get("ref_type", "unknown"),
+        "ref": get("ref", "unknown"),
+        "repository": repo,
+        "repository_url": repo_url,
+    }
+
+def _simplify_watch(repo: str, repo_url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Simplify a WatchEvent payload."""
+    return {
+        "action": payload.get("action", "unknown"),
+        "repository": repo,
+        "repository_url": repo_url,
+    }
+
+def _describe_push(details: Dict[str, Any]) -> str:
+    """Describe a PushEvent."""
+    commit_count = details["commit_count"]
+    repo = details["repository"]
+    branch = details["ref"].replace("refs/heads/", "")
+    commit_msg = ""
+    if details["commit_messages"]:
+        commit_msg = f": {details['commit_messages'][0]}"
+    return f"Pushed {commit_count} commit{'s' if commit_count > 1 else ''} to {repo}/{branch}{commit_msg}"
+
+def _describe_pull_request(details: Dict[str, Any]) -> str:
+    """Describe a PullRequestEvent."""
+    action = details["action"]
+    title = details["title"]
+    number = details["number"]
+    repo = details["repository"]
+    return f"{action.capitalize()} PR #{number} in {repo}: {title}"
+
+def _describe_issue(details: Dict[str, Any]) -> str:
+    """Describe an IssuesEvent."""
+    action = details["action"]
+    title = details["title"]
+    number = details["number"]
+    repo = details["repository"]
+    return f"{action.capitalize()} issue #{number} in {repo}: {title}"
+
+def _describe_issue_comment(details: Dict[str, Any]) -> str:
+    """Describe an IssueCommentEvent."""
+    repo = details["repository"]
+    number = details["issue_number"]
+    comment = details["comment_fragment"]
+    return f"Commented on issue #{number} in {repo}: {comment}"
+
+def _describe_create(details: Dict[str, Any]) -> str:
+    """Describe a CreateEvent."""
+    ref_type = details["ref_type"]
+    ref = details["ref"]
+    repo = details["repository"]
+    return f"Created {ref_type} {ref} in {repo}"
+
+def _describe_delete(details: Dict[str, Any]) -> str:
+    """Describe a DeleteEvent."""
+    ref_type = details["ref_type"]
+    ref = details["ref"]
+    repo = details["repository"]
+    return f"Deleted {ref_type} {ref} in {repo}"
+
+def _describe_watch(details: Dict[str, Any]) -> str:
+    """Describe a WatchEvent."""
+    repo = details["repository"]
+    return f"Starred repository {repo}"
+
+# Per event type handlers, looked up once per event instead of an if/elif chain
+_SIMPLIFIERS: Dict[str, Callable[[str, str, Dict[str, Any]], Dict[str, Any]]] = {
+    "PushEvent": _simplify_push,
+    "PullRequestEvent": _simplify_pull_request,
+    "IssuesEvent": _simplify_issue,
+    "IssueCommentEvent": _simplify_issue_comment,
+    "CreateEvent": _simplify_create,
+    "DeleteEvent": _simplify_delete,
+    "WatchEvent": _simplify_watch,
+}
+
+_DESCRIBERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "PushEvent": _describe_push,
+    "PullRequestEvent": _describe_pull_request,
+    "IssuesEvent": _describe_issue,
+    "IssueCommentEvent": _describe_issue_comment,
+    "CreateEvent": _describe_create,
+    "DeleteEvent": _describe_delete,
+    "WatchEvent": _describe_watch,
+}
+
 class GitHubActivitySource:
     """GitHub implementation of ActivitySource protocol."""
     
@@ -16,216 +229,159 @@ class GitHubActivitySource:
             "Accept": "application/vnd.github.v3+json"
         }
         self.organization = organization
+        self._org_prefix = f"{organization}/" if organization else None
         self.logger = logger.getChild(self.__class__.__name__)
+        self.session = _SESSION
         
-        if organization:
-            self.logger.info(f"Initialized GitHub source for organization: {organization}")
+        # Conditional request state, keyed by URL
+        self._etags: Dict[str, str] = {}
+        self._cache: Dict[str, Tuple[Any, Dict[str, Dict[str, str]]]] = {}
         
-        # Configure session with optional retries
-        self.session = requests.Session()
+        if organization:
+            self.logger.info("Initialized GitHub source for organization: %s", organization)
+
+    def _request(self, url: str) -> requests.Response:
+        """Issue a GET request against the GitHub API."""
+        self.logger.debug("Fetching data from: %s", url)
+        headers = self.headers
+        etag = self._etags.get(url)
+        if etag:
+            # Lets GitHub answer 304 Not Modified for unchanged resources
+            headers = {**headers, "If-None-Match": etag}
+        response = self.session.get(url, headers=headers)
         
-        # Get retry configuration from environment
-        retry_total = int(get_env_var("GITHUB_RETRY_TOTAL", "0"))
-        retry_backoff = float(get_env_var("GITHUB_RETRY_BACKOFF", "0.1"))
+        # Log rate limit information
+        rate_limit_reset = response.headers.get('X-RateLimit-Reset', 'unknown')
+        if self.logger.isEnabledFor(logging.DEBUG):
+            rate_limit = response.headers.get('X-RateLimit-Remaining', 'unknown')
+            self.logger.debug("GitHub API rate limit remaining: %s", rate_limit)
         
-        if retry_total > 0:
-            retry_strategy = Retry(
-                total=retry_total,
-                backoff_factor=retry_backoff,
-                status_forcelist=[429, 500, 502, 503, 504],
-            )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            self.session.mount("https://", adapter)
-            self.session.mount("http://", adapter)
-            
-            self.logger.debug(
-                f"Configured request retries: total={retry_total}, "
-                f"backoff={retry_backoff}"
+        if response.status_code == 403 and response.headers.get('X-RateLimit-Remaining') == '0':
+            reset_time = datetime.fromtimestamp(int(rate_limit_reset))
+            self.logger.error("GitHub API rate limit exceeded. Reset time: %s", reset_time)
+        elif response.status_code == 403 and self._is_secondary_rate_limit(response):
+            self.logger.error(
+                "GitHub API secondary rate limit hit. Retry after: %s",
+                response.headers.get('Retry-After', 'unknown'),
             )
+        elif response.status_code in (401, 403):
+            raise CredentialsError(f"GitHub rejected the configured token (HTTP {response.status_code})")
+        
+        response.raise_for_status()
+        return response
 
-    def _fetch_github_data(self, url: str) -> dict[str, Any]:
-        """Fetch data from GitHub API."""
-        self.logger.debug(f"Fetching data from: {url}")
+    def _is_secondary_rate_limit(self, response: requests.Response) -> bool:
+        """Check if a 403 response is GitHub's secondary rate limit rather than an auth failure."""
+        return 'Retry-After' in response.headers or b"rate limit" in response.content.lower()
+
+    def _parse_response(self, response: requests.Response) -> Any:
+        """Decode the JSON body of a GitHub API response."""
         try:
-            response = self.session.get(url, headers=self.headers)
-            
-            # Log rate limit information
-            rate_limit = response.headers.get('X-RateLimit-Remaining', 'unknown')
-            rate_limit_reset = response.headers.get('X-RateLimit-Reset', 'unknown')
-            self.logger.debug(f"GitHub API rate limit remaining: {rate_limit}")
-            
-            if response.status_code == 403 and 'X-RateLimit-Remaining' in response.headers and response.headers['X-RateLimit-Remaining'] == '0':
-                reset_time = datetime.fromtimestamp(int(rate_limit_reset))
-                self.logger.error(f"GitHub API rate limit exceeded. Reset time: {reset_time}")
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise requests.RequestException(
+                f"Invalid JSON in GitHub response: {str(e)}",
+                response=response,
+            ) from e
+
+    def _fetch_json(self, url: str) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+        """Fetch a GitHub API URL, returning its decoded body and Link header."""
+        response = self._request(url)
+        if response.status_code == 304:
+            self.logger.debug("Not modified, using cached response for: %s", url)
+            return self._cache[url]
+        
+        result = (self._parse_response(response), response.links)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._cache[url] = result
+            self._etags[url] = etag
+        return result
+
+    def _fetch_page(self, url: str) -> Any:
+        """Fetch and decode a single GitHub API URL."""
+        return self._fetch_json(url)[0]
+
+    def _page_urls(self, links: Dict[str, Dict[str, str]]) -> List[str]:
+        """Enumerate the URLs of all pages after the first from a Link header."""
+        last = links.get("last")
+        if not last:
+            return []
+        
+        parts = urlsplit(last["url"])
+        query = parse_qs(parts.query)
+        last_page = int(query.get("page", ["1"])[0])
+        
+        urls = []
+        for page in range(2, last_page + 1):
+            query["page"] = [str(page)]
+            urls.append(urlunsplit(parts._replace(query=urlencode(query, doseq=True))))
+        return urls
+
+    def _fetch_many(self, urls: List[str]) -> List[Any]:
+        """Fetch several GitHub API URLs concurrently, preserving order."""
+        results: List[Any] = [None] * len(urls)
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            futures = {
+                executor.submit(self._fetch_page, url): index
+                for index, url in enumerate(urls)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+
+    def _fetch_github_data(self, url: str, paginate: bool = False) -> Any:
+        """Fetch data from GitHub API, optionally following all result pages.
+
+        Decoded bodies are shared with the ETag cache, so callers must treat
+        the result as read-only.
+        """
+        try:
+            data, links = self._fetch_json(url)
+            if not paginate:
+                return data
             
-            response.raise_for_status()
-            return response.json()
+            # Remaining pages are known from the Link header, fetch them in parallel
+            page_urls = self._page_urls(links)
+            if not page_urls:
+                return data
+            self.logger.debug("Fetching %d additional pages", len(page_urls))
+            pages = [data, *self._fetch_many(page_urls)]
+            # Combine into a new list rather than extending the cached first page
+            return [item for page in pages for item in page]
         except requests.RequestException as e:
-            self.logger.error(f"Error fetching GitHub data: {str(e)}")
+            self.logger.error("Error fetching GitHub data: %s", e)
             raise
         
-    def __del__(self):
-        """Cleanup session on object destruction."""
-        self.session.close()
-
-    def _simplify_event_details(self, event_type: str, event: Dict[str, Any]) -> Dict[str, Any]:
+    def _simplify_event_details(self, event_type: str, repo: str, event: Dict[str, Any]) -> Dict[str, Any]:
         """Simplify event details based on event type."""
-        simplified = {}
+        repo_url = f"{_BASE_URL}/{repo}"
+        
+        simplify = _SIMPLIFIERS.get(event_type)
+        if simplify is None:
+            # For other event types, include basic info
+            return {
+                "event_type": event_type,
+                "repository": repo,
+                "repository_url": repo_url,
+            }
         
         try:
-            # Get repository name from the event
-            repo = event.get("repo", {}).get("name", "unknown")
-            payload = event.get("payload", {})
-            
-            # Base GitHub URL for constructing links
-            base_url = "https://github.com"
-            repo_url = f"{base_url}/{repo}"
-            
-            if event_type == "PushEvent":
-                ref = payload.get("ref", "unknown")
-                branch = ref.replace("refs/heads/", "")
-                simplified = {
-                    "repository": repo,
-                    "repository_url": repo_url,
-                    "ref": ref,
-                    "commit_count": len(payload.get("commits", [])),
-                    "commit_messages": [
-                        commit.get("message", "").split("\n")[0]  # First line only
-                        for commit in payload.get("commits", [])[:3]  # First 3 commits only
-                    ],
-                    "compare_url": f"{repo_url}/compare/{payload.get('before', '')}...{payload.get('head', '')}"
-                }
-            
-            elif event_type == "PullRequestEvent":
-                pr = payload.get("pull_request", {})
-                simplified = {
-                    "action": payload.get("action", "unknown"),
-                    "title": pr.get("title", "unknown"),
-                    "number": pr.get("number", "unknown"),
-                    "repository": repo,
-                    "repository_url": repo_url,
-                    "state": pr.get("state", "unknown"),
-                    "url": pr.get("html_url"),
-                }
-            
-            elif event_type == "IssuesEvent":
-                issue = payload.get("issue", {})
-                simplified = {
-                    "action": payload.get("action", "unknown"),
-                    "title": issue.get("title", "unknown"),
-                    "number": issue.get("number", "unknown"),
-                    "repository": repo,
-                    "repository_url": repo_url,
-                    "url": issue.get("html_url"),
-                }
-            
-            elif event_type == "IssueCommentEvent":
-                simplified = {
-                    "action": payload.get("action", "unknown"),
-                    "issue_number": payload.get("issue", {}).get("number", "unknown"),
-                    "repository": repo,
-                    "repository_url": repo_url,
-                    "comment_fragment": payload.get("comment", {}).get("body", "")[:100] + "...",
-                    "url": payload.get("comment", {}).get("html_url"),
-                    "issue_url": payload.get("issue", {}).get("html_url"),
-                }
-            
-            elif event_type == "CreateEvent":
-                ref_type = payload.get("ref_type", "unknown")
-                ref = payload.get("ref", "unknown")
-                simplified = {
-                    "ref_type": ref_type,
-                    "ref": ref,
-                    "repository": repo,
-                    "repository_url": repo_url,
-                    "url": (
-                        f"{repo_url}/tree/{ref}" if ref_type == "branch"
-                        else f"{repo_url}/releases/tag/{ref}" if ref_type == "tag"
-                        else repo_url
-                    ),
-                }
-            
-            elif event_type == "DeleteEvent":
-                simplified = {
-                    "ref_type": payload.get("ref_type", "unknown"),
-                    "ref": payload.get("ref", "unknown"),
-                    "repository": repo,
-                    "repository_url": repo_url,
-                }
-            
-            elif event_type == "WatchEvent":
-                simplified = {
-                    "action": payload.get("action", "unknown"),
-                    "repository": repo,
-                    "repository_url": repo_url,
-                }
-            
-            else:
-                # For other event types, include basic info
-                simplified = {
-                    "event_type": event_type,
-                    "repository": repo,
-                    "repository_url": repo_url,
-                }
+            return simplify(repo, repo_url, event.get("payload") or _EMPTY)
         except Exception as e:
-            self.logger.warning(f"Error simplifying {event_type} event: {str(e)}")
-            simplified = {"error": "Failed to process event details"}
-        
-        return simplified
+            self.logger.warning("Error simplifying %s event: %s", event_type, e)
+            return {"error": "Failed to process event details"}
 
     def _get_human_readable_message(self, event_type: str, details: Dict[str, Any]) -> str:
         """Generate human readable message for the event."""
+        describe = _DESCRIBERS.get(event_type)
+        if describe is None:
+            return f"Performed {event_type} on {details.get('repository', 'unknown repository')}"
+        
         try:
-            if event_type == "PushEvent":
-                commit_count = details["commit_count"]
-                repo = details["repository"]
-                branch = details["ref"].replace("refs/heads/", "")
-                commit_msg = ""
-                if details["commit_messages"]:
-                    commit_msg = f": {details['commit_messages'][0]}"
-                return f"Pushed {commit_count} commit{'s' if commit_count > 1 else ''} to {repo}/{branch}{commit_msg}"
-            
-            elif event_type == "PullRequestEvent":
-                action = details["action"]
-                title = details["title"]
-                number = details["number"]
-                repo = details["repository"]
-                return f"{action.capitalize()} PR #{number} in {repo}: {title}"
-            
-            elif event_type == "IssuesEvent":
-                action = details["action"]
-                title = details["title"]
-                number = details["number"]
-                repo = details["repository"]
-                return f"{action.capitalize()} issue #{number} in {repo}: {title}"
-            
-            elif event_type == "IssueCommentEvent":
-                repo = details["repository"]
-                number = details["issue_number"]
-                comment = details["comment_fragment"]
-                return f"Commented on issue #{number} in {repo}: {comment}"
-            
-            elif event_type == "CreateEvent":
-                ref_type = details["ref_type"]
-                ref = details["ref"]
-                repo = details["repository"]
-                return f"Created {ref_type} {ref} in {repo}"
-            
-            elif event_type == "DeleteEvent":
-                ref_type = details["ref_type"]
-                ref = details["ref"]
-                repo = details["repository"]
-                return f"Deleted {ref_type} {ref} in {repo}"
-            
-            elif event_type == "WatchEvent":
-                repo = details["repository"]
-                return f"Starred repository {repo}"
-            
-            else:
-                return f"Performed {event_type} on {details.get('repository', 'unknown repository')}"
-                
+            return describe(details)
         except Exception as e:
-            self.logger.warning(f"Error creating message for {event_type}: {str(e)}")
+            self.logger.warning("Error creating message for %s: %s", event_type, e)
             return f"Performed {event_type}"
 
     def validate_credentials(self) -> bool:
@@ -235,18 +391,10 @@ class GitHubActivitySource:
             self._fetch_github_data("https://api.github.com/user")
             self.logger.info("GitHub credentials validated successfully")
             return True
-        except requests.RequestException as e:
-            self.logger.error(f"GitHub credential validation failed: {str(e)}")
+        except (requests.RequestException, CredentialsError) as e:
+            self.logger.error("GitHub credential validation failed: %s", e)
             return False
 
-    def _is_org_event(self, event: Dict[str, Any]) -> bool:
-        """Check if event is related to the configured organization."""
-        if not self.organization:
-            return True
-            
-        repo_name = event.get("repo", {}).get("name", "")
-        return repo_name.startswith(f"{self.organization}/")
-
     def get_activities(
         self,
         username: str,
@@ -254,52 +402,61 @@ class GitHubActivitySource:
         end_date: Optional[datetime] = None,
     ) -> List[Activity]:
         """Get GitHub activities for a user."""
-        self.logger.info(f"Fetching GitHub activities for user: {username}")
+        self.logger.info("Fetching GitHub activities for user: %s", username)
         if self.organization:
-            self.logger.info(f"Filtering for organization: {self.organization}")
+            self.logger.info("Filtering for organization: %s", self.organization)
 
-        # Convert dates to GitHub API format
-        start_date_str = start_date.isoformat() + "Z" if start_date else None
-        end_date_str = end_date.isoformat() + "Z" if end_date else None
-        
-        self.logger.debug(f"Date range: {start_date_str} to {end_date_str}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Convert dates to GitHub API format
+            start_date_str = start_date.isoformat() + "Z" if start_date else None
+            end_date_str = end_date.isoformat() + "Z" if end_date else None
+            self.logger.debug("Date range: %s to %s", start_date_str, end_date_str)
 
         # Fetch events from GitHub API
-        url = f"https://api.github.com/users/{username}/events"
+        url = f"https://api.github.com/users/{username}/events?per_page=100"
         try:
-            events_data = self._fetch_github_data(url)
+            events_data = self._fetch_github_data(url, paginate=True)
         except Exception as e:
-            self.logger.error(f"Failed to fetch GitHub events: {str(e)}")
+            self.logger.error("Failed to fetch GitHub events: %s", e)
             raise
 
         activities = []
         for event in events_data:
+            # Skip malformed events up front instead of guarding each one
+            event_type = event.get("type")
+            created_at = event.get("created_at")
+            if not event_type or not created_at:
+                self.logger.warning("Skipping event without type or timestamp: %s", event.get("id"))
+                continue
+            
+            # Get repository name from the event, once
+            repo = event.get("repo") or _EMPTY
+            repo_name = repo.get("name", "unknown") if isinstance(repo, dict) else None
+            if not isinstance(repo_name, str):
+                self.logger.warning("Skipping event with malformed repo: %s", event.get("id"))
+                continue
+            
+            # Skip events not related to the configured organization
+            if self._org_prefix is not None and not repo_name.startswith(self._org_prefix):
+                continue
+            
             try:
-                # Skip events not related to the configured organization
-                if not self._is_org_event(event):
-                    continue
-                    
-                simplified_details = self._simplify_event_details(
-                    event["type"],
-                    event
-                )
-                
-                human_message = self._get_human_readable_message(
-                    event["type"],
-                    simplified_details
-                )
-                
-                activity = Activity(
-                    source="github",
-                    timestamp=datetime.fromisoformat(event["created_at"].replace("Z", "+00:00")),
-                    type=event["type"],
-                    details=simplified_details,
-                    message=human_message
-                )
-                activities.append(activity)
-            except Exception as e:
-                self.logger.warning(f"Failed to process event: {str(e)}")
+                timestamp = _parse_ts(created_at)
+            except (TypeError, ValueError) as e:
+                self.logger.warning("Skipping event with invalid timestamp %r: %s", created_at, e)
                 continue
+                
+            simplified_details = self._simplify_event_details(event_type, repo_name, event)
+            human_message = self._get_human_readable_message(event_type, simplified_details)
+            
+            activity = Activity(
+                source="github",
+                timestamp=timestamp,
+                type=event_type,
+                details=simplified_details,
+                message=human_message
+            )
+            activities.append(activity)
 
-        self.logger.info(f"Retrieved {len(activities)} GitHub activities")
+        self.logger.info("Retrieved %d GitHub activities", len(activities))
         return activities 
\ No newline at end of file
@@ -1,11 +1,14 @@
 import logging
 import sys
+from logging.handlers import MemoryHandler
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from ..config import get_env_var
 
 DEFAULT_LOG_LEVEL = "INFO"
+# Number of records buffered before the log file is written
+LOG_FILE_BUFFER_CAPACITY = 1024
 
 def setup_logging(
     log_file: Optional[Path] = None,
@@ -20,7 +23,13 @@ def setup_logging(
     logger = logging.getLogger(module)
     logger.setLevel(level)
     
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers to avoid duplicates, flushing any buffered records
+    for handler in logger.handlers:
+        # MemoryHandler.close flushes but leaves its target open
+        target = handler.target if isinstance(handler, MemoryHandler) else None
+        handler.close()
+        if target is not None:
+            target.close()
     logger.handlers.clear()
     
     # Create formatters
@@ -37,12 +46,18 @@ def setup_logging(
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
     
-    # File handler (if log_file is provided)
+    # File handler (if log_file is provided), buffered to batch writes;
+    # logging.shutdown flushes and closes both handlers at exit
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        buffered_handler = MemoryHandler(
+            LOG_FILE_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+        )
+        logger.addHandler(buffered_handler)
     
     return logger
 
@@ -0,0 +1,57 @@
+import pytest
+from datetime import datetime
+from git_stalker.core.base import Activity, ActivityTracker
+
+class FakeSource:
+    def __init__(self, name, hours):
+        self.activities = [
+            Activity(
+                source=name,
+                timestamp=datetime(2024, 2, 20, hour),
+                type="PushEvent",
+                details={},
+                message=f"{name} at {hour}",
+            )
+            for hour in hours
+        ]
+
+    def get_activities(self, username, start_date=None, end_date=None):
+        return self.activities
+
+    def validate_credentials(self):
+        return True
+
+def test_tracker_merges_sources_newest_first():
+    tracker = ActivityTracker()
+    tracker.add_source(FakeSource("a", [12, 8, 3]))
+    tracker.add_source(FakeSource("b", [10, 9, 1]))
+
+    activities = tracker.get_all_activities("testuser")
+    assert [a.timestamp.hour for a in activities] == [12, 10, 9, 8, 3, 1]
+
+def test_tracker_rejects_invalid_source():
+    tracker = ActivityTracker()
+    with pytest.raises(TypeError):
+        tracker.add_source(object())
+
+class RejectedSource(FakeSource):
+    def validate_credentials(self):
+        raise AssertionError("credentials should not be validated eagerly")
+
+def test_tracker_defers_credential_validation(monkeypatch):
+    monkeypatch.delenv("GIT_STALKER_LAZY_AUTH", raising=False)
+    tracker = ActivityTracker()
+    tracker.add_source(RejectedSource("a", [12]))
+    assert len(tracker.sources) == 1
+
+def test_tracker_keeps_lazy_auth_for_other_values(monkeypatch):
+    monkeypatch.setenv("GIT_STALKER_LAZY_AUTH", "true")
+    tracker = ActivityTracker()
+    tracker.add_source(RejectedSource("a", [12]))
+    assert len(tracker.sources) == 1
+
+def test_tracker_validates_credentials_when_lazy_auth_disabled(monkeypatch):
+    monkeypatch.setenv("GIT_STALKER_LAZY_AUTH", "0")
+    tracker = ActivityTracker()
+    with pytest.raises(AssertionError):
+        tracker.add_source(RejectedSource("a", [12]))
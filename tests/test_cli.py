@@ -0,0 +1,69 @@
+import importlib
+import json
+import pytest
+from datetime import datetime, timezone
+from typer.testing import CliRunner
+from git_stalker.core.base import Activity
+
+# git_stalker.cli re-exports the main() function under the module's name
+cli = importlib.import_module("git_stalker.cli.main")
+
+ACTIVITIES = [
+    Activity(
+        source="github",
+        timestamp=datetime(2024, 2, 20, 12, 0, tzinfo=timezone.utc),
+        type="PushEvent",
+        details={"repository": "org/repo"},
+        message="fix [bold]x[/bold]",
+    ),
+    Activity(
+        source="github",
+        timestamp=datetime(2024, 2, 19, 9, 30, tzinfo=timezone.utc),
+        type="WatchEvent",
+        details={"repository": "org/other"},
+        message="Starred repository org/other",
+    ),
+]
+
+class FakeTracker:
+    def add_source(self, source):
+        pass
+
+    def get_all_activities(self, username, start_date=None, end_date=None):
+        return ACTIVITIES
+
+@pytest.fixture
+def runner(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "ERROR")
+    monkeypatch.setattr(cli, "get_github_token", lambda: "dummy_token")
+    monkeypatch.setattr(cli, "ActivityTracker", FakeTracker)
+    return CliRunner()
+
+def test_cli_pretty_output(runner):
+    result = runner.invoke(cli.app, ["testuser"])
+    assert result.exit_code == 0
+    assert result.output.split("\n") == [
+        "2024-02-20 12:00:00",
+        "github: fix [bold]x[/bold]",
+        "",
+        "2024-02-19 09:30:00",
+        "github: Starred repository org/other",
+        "",
+        "",
+    ]
+
+def test_cli_json_output(runner):
+    result = runner.invoke(cli.app, ["testuser", "--output-format", "json"])
+    assert result.exit_code == 0
+    activities = json.loads(result.output)
+    assert [a["timestamp"] for a in activities] == [
+        "2024-02-20T12:00:00+00:00",
+        "2024-02-19T09:30:00+00:00",
+    ]
+    assert activities[0] == {
+        "source": "github",
+        "timestamp": "2024-02-20T12:00:00+00:00",
+        "type": "PushEvent",
+        "details": {"repository": "org/repo"},
+        "message": "fix [bold]x[/bold]",
+    }
@@ -1,7 +1,8 @@
 import pytest
+import requests
 from datetime import datetime
 from git_stalker.core.github import GitHubActivitySource
-from git_stalker.core.base import Activity
+from git_stalker.core.base import Activity, CredentialsError
 
 def test_github_source_initialization():
     token = "dummy_token"
@@ -22,9 +23,101 @@ def mock_github_source(monkeypatch):
     monkeypatch.setattr(source, "_fetch_github_data", mock_fetch_data)
     return source
 
+class FakeResponse:
+    def __init__(self, body, links=None, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = body
+        self.links = links or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.sent_headers = []
+
+    def get(self, url, headers=None):
+        self.sent_headers.append(headers)
+        response = self.responses[url]
+        return response.pop(0) if isinstance(response, list) else response
+
 def test_github_source_get_activities(mock_github_source):
     activities = mock_github_source.get_activities("testuser")
     assert len(activities) == 1
     assert isinstance(activities[0], Activity)
     assert activities[0].source == "github"
-    assert activities[0].type == "PushEvent" 
\ No newline at end of file
+    assert activities[0].type == "PushEvent"
+
+def test_github_source_fetches_all_pages(monkeypatch):
+    base = "https://api.github.com/users/testuser/events?per_page=100"
+    pages = {
+        base: FakeResponse(
+            b'[{"id": 1}]',
+            links={"last": {"url": f"{base}&page=3"}},
+        ),
+        f"{base}&page=2": FakeResponse(b'[{"id": 2}]'),
+        f"{base}&page=3": FakeResponse(b'[{"id": 3}]'),
+    }
+
+    source = GitHubActivitySource("dummy_token")
+    monkeypatch.setattr(source, "session", FakeSession(pages))
+    data = source._fetch_github_data(base, paginate=True)
+    assert [event["id"] for event in data] == [1, 2, 3]
+
+def test_github_source_reuses_cached_body_on_not_modified(monkeypatch):
+    url = "https://api.github.com/user"
+    session = FakeSession({
+        url: [
+            FakeResponse(b'{"login": "testuser"}', headers={"ETag": '"abc"'}),
+            FakeResponse(b"", status_code=304),
+        ],
+    })
+
+    source = GitHubActivitySource("dummy_token")
+    monkeypatch.setattr(source, "session", session)
+    assert source._fetch_github_data(url) == {"login": "testuser"}
+    assert source._fetch_github_data(url) == {"login": "testuser"}
+    assert "If-None-Match" not in session.sent_headers[0]
+    assert session.sent_headers[1]["If-None-Match"] == '"abc"'
+
+def test_github_source_rejected_token_raises_credentials_error(monkeypatch):
+    url = "https://api.github.com/users/testuser/events?per_page=100"
+    session = FakeSession({url: FakeResponse(b"", status_code=401)})
+
+    source = GitHubActivitySource("dummy_token")
+    monkeypatch.setattr(source, "session", session)
+    with pytest.raises(CredentialsError):
+        source.get_activities("testuser")
+
+def test_github_source_skips_malformed_events(monkeypatch):
+    def mock_fetch_data(*args, **kwargs):
+        return [
+            {"type": "WatchEvent", "created_at": "2024-02-20T12:00:00Z", "repo": {"name": "o/a"}},
+            {"type": "WatchEvent", "created_at": "garbage", "repo": {"name": "o/b"}},
+            {"type": "WatchEvent", "created_at": "2024-02-20T11:00:00Z", "repo": "o/c"},
+            {"type": "WatchEvent", "created_at": "2024-02-20T10:00:00Z", "repo": {"name": 42}},
+            {"type": "WatchEvent", "created_at": "2024-02-20T09:00:00Z", "repo": {"name": "o/d"}},
+        ]
+
+    source = GitHubActivitySource("dummy_token")
+    monkeypatch.setattr(source, "_fetch_github_data", mock_fetch_data)
+    activities = source.get_activities("testuser")
+    assert [a.details["repository"] for a in activities] == ["o/a", "o/d"]
+
+def test_github_source_secondary_rate_limit_is_not_credentials_error(monkeypatch):
+    url = "https://api.github.com/user"
+    session = FakeSession({
+        url: FakeResponse(
+            b'{"message": "You have exceeded a secondary rate limit."}',
+            status_code=403,
+            headers={"Retry-After": "60", "X-RateLimit-Remaining": "4999"},
+        ),
+    })
+
+    source = GitHubActivitySource("dummy_token")
+    monkeypatch.setattr(source, "session", session)
+    with pytest.raises(requests.HTTPError):
+        source._fetch_github_data(url)